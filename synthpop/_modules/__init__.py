@@ -1,6 +1,6 @@
 try:
     from .. import constants as const
-    from ..synthpop_utils import default_sun
+    from ..synthpop_utils import default_sun, generator_from_global_state, HAS_NUMBA, njit, prange
 except ImportError:
     import constants as const
-    from synthpop_utils import default_sun
+    from synthpop_utils import default_sun, generator_from_global_state, HAS_NUMBA, njit, prange
@@ -7,6 +7,9 @@ __license__ = "GPLv3"
 __version__ = "1.0.0"
 
 import numpy as np
+from scipy.special import ndtr, ndtri
+from scipy.stats import truncnorm
+from .. import generator_from_global_state
 from ._age import Age
 
 
@@ -53,6 +56,19 @@ class Gaussian(Age):
         if self.lower >= self.upper:
             raise ValueError(f"{low_bound = } has to be strictly smaller than {high_bound = }")
 
+        # truncation bounds in units of the standard deviation
+        self._a = (self.lower - self.mean) / self.std
+        self._b = (self.upper - self.mean) / self.std
+        # CDF at the bounds for inverse transform sampling.
+        # if both bounds are above the mean, the mirrored distribution is used
+        # to keep the precision in the upper tail
+        self._flip = self._a > 0
+        if self._flip:
+            self._phi_lo, self._phi_hi = ndtr(-self._b), ndtr(-self._a)
+        else:
+            self._phi_lo, self._phi_hi = ndtr(self._a), ndtr(self._b)
+        self._rng = generator_from_global_state()
+
     def draw_random_age(self, N: int or None = None, **kwargs) -> np.ndarray or float:
         """
         Returns one or more metallicities in [Fe/H] from a Gaussian distribution.
@@ -67,21 +83,16 @@ class Gaussian(Age):
         val : ndarray, float [Gyr]
             single metallicities or ndarray of N metallicities in [Fe/H]
         """
-        if N is None:
-            # generate a single value
-            while True:
-                val = np.random.normal(self.mean, self.std)
-                if self.lower < val < self.upper:
-                    return val
+        if self._phi_hi <= self._phi_lo:
+            # CDF underflows for windows far in the tail,
+            # truncnorm handles those with a dedicated tail sampler
+            return truncnorm.rvs(self._a, self._b, loc=self.mean, scale=self.std, size=N,
+                                 random_state=self._rng)
 
-        else:
-            # generate multiple values
-            val = np.random.normal(self.mean, self.std, N)
-            while True:
-                outside = (self.lower > val) | (val > self.upper)
-                if not any(outside):
-                    return val
-                val[outside] = np.random.normal(self.mean, self.std, sum(outside))
+        # inverse transform sampling,
+        # avoids the argument validation of truncnorm.rvs on every call
+        x = ndtri(self._rng.uniform(self._phi_lo, self._phi_hi, N))
+        return self.mean + self.std * (-x if self._flip else x)
 
     def average_age(self) -> float:
         """Determine the average age of the population"""
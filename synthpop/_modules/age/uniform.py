@@ -8,6 +8,7 @@ __version__ = "1.0.0"
 
 
 import numpy as np
+from .. import generator_from_global_state
 from ._age import Age
 
 
@@ -41,6 +42,8 @@ class Uniform(Age):
         self.age_func_name = 'uniform'
         self.low_bound = low_bound
         self.high_bound = high_bound
+        self._span = high_bound - low_bound
+        self._rng = generator_from_global_state()
 
     def draw_random_age(self, N: float or None = None) -> np.ndarray or float:
         """
@@ -56,7 +59,7 @@ class Uniform(Age):
         age : ndarray, float [Gyr]
             single age or numpy array of N ages in Giga-years
         """
-        return np.random.uniform(self.low_bound, self.high_bound, N)
+        return self._rng.random(N) * self._span + self.low_bound
 
     def average_age(self) -> float:
         """ Determine the average age of the population """
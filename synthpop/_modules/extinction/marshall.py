@@ -13,12 +13,79 @@ __date__ = "2022-07-10"
 __license__ = "GPLv3"
 __version__ = "1.0.0"
 
-import linecache
+from functools import lru_cache
+from typing import Tuple
 import numpy as np
-from scipy.spatial import distance as sci_distance
+import pandas
+from scipy.spatial import cKDTree
 from ._extinction import ExtinctionMap, EXTINCTION_DIR
 import time
 
+# maximum number of columns in marshall_table1.csv (5 + 4 * 33 bins)
+MARSHALL_TABLE_N_COLUMNS = 137
+
+
+@lru_cache(maxsize=None)
+def _load_marshall_table() -> Tuple[np.ndarray, np.ndarray, np.ndarray, cKDTree, float]:
+    """
+    Reads in marshall_table1.csv and builds the tree for the nearest sightline lookup.
+    The result is cached, such that all Marshall instances share a single read-only copy.
+
+    Returns
+    -------
+    data : ndarray
+        all rows of the table concatenated into a single flat array.
+        sightlines have a different number of bins, so the rows are stored ragged.
+    offsets : ndarray
+        row i is data[offsets[i]:offsets[i + 1]]
+    coords : ndarray [degree]
+        (l, b) coordinates of the sightlines
+    tree : cKDTree
+        tree over the (l, b) coordinates of the sightlines
+    l_stepsize : float [degree]
+        step size in galactic longitude
+    """
+    # read in padded with NaN, and only keep the actual values
+    table = pandas.read_csv(
+        f'{EXTINCTION_DIR}/marshall_table1.csv', header=None,
+        names=range(MARSHALL_TABLE_N_COLUMNS)).to_numpy()
+    is_value = ~np.isnan(table)
+    data = table[is_value]
+    offsets = np.concatenate(([0], np.cumsum(is_value.sum(axis=1))))
+    coords = np.ascontiguousarray(table[:, :2])
+    for array in (data, offsets, coords):
+        array.flags.writeable = False
+    tree = cKDTree(coords)
+    l_stepsize = coords[1, 0] - coords[0, 0]
+    return data, offsets, coords, tree, l_stepsize
+
+
+def _eval_sightline_extinction(
+        edges: np.ndarray, aks: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the extinction in the map for radii along a single sightline.
+    Does not depend on the state of a Marshall instance,
+    so it can be mapped over several sightlines by parallel workers, e.g.
+    pool.starmap(_eval_sightline_extinction, [(edges, aks, radii) for ...])
+
+    Parameters
+    ----------
+    edges : ndarray [kpc]
+        sorted bin edges of the sightline
+    aks : ndarray [mag]
+        extinction A_Ks at each bin edge
+    radii : ndarray [kpc]
+        radial distances
+
+    Returns
+    -------
+    A_Ks : ndarray [mag]
+        extinction in the map for each radius
+    """
+    radius_ind = np.searchsorted(edges, radii, side='right') - 1
+    # same as Marshall.update_extinction_in_map, zero if we are not beyond the first bin
+    return np.where(radius_ind > 0, aks[np.maximum(radius_ind, 0)], 0.)
+
 
 class Marshall(ExtinctionMap):
     """
@@ -55,6 +122,9 @@ class Marshall(ExtinctionMap):
         calls find_sightline() and init_sightline()
     update_extinction_in_map() :
 
+    extinction_for_radii(radii) :
+        returns the extinction for an array of radii on the current sightline
+
     init_sightline(self) :
 
     find_sightline(self) :
@@ -86,11 +156,13 @@ class Marshall(ExtinctionMap):
         self.extinction_in_map = None
         self.extinction_in_map_err = None
 
-        # get coordinates from marshall_table1.csv
-        self.all_coords = np.genfromtxt(f'{EXTINCTION_DIR}/marshall_table1.csv',
-            usecols=[0, 1], delimiter=',')
-
-        self.l_stepsize = self.all_coords[1, 0] - self.all_coords[0, 0]
+        # marshall_table1.csv is read on the first sightline query,
+        # see _ensure_loaded
+        self._data = None
+        self._offsets = None
+        self.all_coords = None
+        self._tree = None
+        self.l_stepsize = None
 
         # placeholders for sightline information
         self.sightline = []
@@ -99,6 +171,10 @@ class Marshall(ExtinctionMap):
         self.chi2_allstars = None
         self.chi2_giants = None
         self.number_of_bins = None
+        self._edges = None
+        self._aks = None
+        self._edges_err = None
+        self._aks_err = None
         # set the radius index to zero
         self.radius_ind = None
         # first bin edge is 0
@@ -115,7 +191,8 @@ class Marshall(ExtinctionMap):
         """
         # Actually, we will digitize this again to find the radius
         # this will return the far edge index, so we will want to subtract 1
-        radius_ind = np.digitize(radius, self.sightline[5::4]) - 1
+        # (bin edges are sorted, so searchsorted gives the same result as np.digitize)
+        radius_ind = np.searchsorted(self._edges, radius, side='right') - 1
 
         # first, we will check if the radius index is different that it already is
         if radius_ind == self.radius_ind and not force:
@@ -126,15 +203,36 @@ class Marshall(ExtinctionMap):
 
         # set to zero if we are not made it into the first bin      
         # now, we can just set the A_Ks value        
-        self.near_bin_edge = self.sightline[5 + radius_ind * 4] if radius_ind > 0 else 0
-        self.near_bin_edge_err = self.sightline[7 + radius_ind * 4] if radius_ind > 0 else 0
+        self.near_bin_edge = self._edges[radius_ind] if radius_ind > 0 else 0
+        self.near_bin_edge_err = self._edges_err[radius_ind] if radius_ind > 0 else 0
 
-        self.extinction_in_map_err = self.sightline[8 + radius_ind * 4] if radius_ind > 0 else 0
-        self.extinction_in_map = self.sightline[6 + radius_ind * 4] if radius_ind > 0 else 0
+        self.extinction_in_map_err = self._aks_err[radius_ind] if radius_ind > 0 else 0
+        self.extinction_in_map = self._aks[radius_ind] if radius_ind > 0 else 0
 
         # a generic function we will place in all self.update_extinction functions
         return 1
 
+    def extinction_for_radii(self, radii: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of update_extinction_in_map.
+        Returns the extinction in the map for each radius of the current sightline
+        without updating the state of the class.
+
+        Parameters
+        ----------
+        radii : ndarray or float [kpc]
+            radial distances
+
+        Returns
+        -------
+        A_Ks : ndarray or float [mag]
+            extinction in the map for each radius
+        """
+        if self._edges is None:
+            raise ValueError("No sightline is set, call update_line_of_sight first")
+        # [()] converts 0-d arrays back to scalars
+        return _eval_sightline_extinction(self._edges, self._aks, radii)[()]
+
     def update_line_of_sight(self, l_deg, b_deg):
         """
         Set a new sight-line
@@ -161,17 +259,32 @@ class Marshall(ExtinctionMap):
         self.chi2_allstars = self.sightline[2]
         self.chi2_giants = self.sightline[3]
         self.number_of_bins = self.sightline[4]
+        # bin edges and extinctions along the sightline,
+        # stored as separate contiguous arrays
+        self._edges = np.ascontiguousarray(self.sightline[5::4])
+        self._aks = np.ascontiguousarray(self.sightline[6::4])
+        self._edges_err = np.ascontiguousarray(self.sightline[7::4])
+        self._aks_err = np.ascontiguousarray(self.sightline[8::4])
         # set the radius index to zero
         self.radius_ind = 0
         # first bin edge is 0
         self.near_bin_edge = 0
         # A_Ks is zero in the zeroth bin
         self.A_Ks = 0
-        self.far_bin_edge = self.sightline[5]
+        self.far_bin_edge = self._edges[0]
         self.far_bin_edge_ind = 5
         self.A_Ks_ind = 6
         self.update_extinction_in_map(self.near_bin_edge, force=True)
 
+    def _ensure_loaded(self):
+        """ gets the shared table, which is read in on the first call """
+        if self._data is not None:
+            return
+
+        # the table is shared between all instances
+        (self._data, self._offsets, self.all_coords,
+         self._tree, self.l_stepsize) = _load_marshall_table()
+
     def find_sightline(self):
         """
         A function for the Marshall map that finds the closest
@@ -180,28 +293,37 @@ class Marshall(ExtinctionMap):
         Can be used to reset the class to a new sightline,
         could be more efficient.
         """
+        self._ensure_loaded()
+
         # find the closest geometric sightline
         # find the index of the minimum distance to a coordinate pair
         if self.l_deg is None:
-            min_dist_arg = sci_distance.cdist(np.array([[0., 0.]]), self.all_coords).argmin()
+            min_dist_arg = self._nearest_sightline(0., 0.)
         else:
             # ensure that if l_deg is (0, 360]
             l_deg = self.l_deg + 360 if self.l_deg < self.l_stepsize / 2 else self.l_deg
 
             # find line of sight with the closest distance
-            min_dist_arg = sci_distance.cdist(
-                np.array([[l_deg, self.b_deg]]),
-                self.all_coords
-                ).argmin()
+            min_dist_arg = self._nearest_sightline(l_deg, self.b_deg)
 
-        # read in that sightline information
-        # getline is 1-indexed
-        line = linecache.getline(f'{EXTINCTION_DIR}/marshall_table1.csv', min_dist_arg + 1)
+        self.sightline = self._get_sightline(min_dist_arg)
+
+    def _nearest_sightline(self, l_deg: float, b_deg: float) -> int:
+        """
+        returns the index of the closest sightline.
+        Up to 4 grid points can have the same distance,
+        in such cases the lowest index is used (same as cdist(...).argmin()).
+        """
+        dist, ind = self._tree.query([l_deg, b_deg], k=4)
+        return ind[dist == dist[0]].min()
 
-        self.sightline = np.fromstring(line, dtype=float, sep=',')
+    def _get_sightline(self, index: int) -> np.ndarray:
+        """ returns the sightline information for a given row of the table """
+        sightline = self._data[self._offsets[index]:self._offsets[index + 1]]
 
         # for 5 locations the last radii is smaller than the 2nd last,
         # but the extinction is higher.
         # in such cases the last location is removed.
-        if any(np.diff(self.sightline[5::4]) < 0):
-            self.sightline = self.sightline[:-4]
+        if any(np.diff(sightline[5::4]) < 0):
+            sightline = sightline[:-4]
+        return sightline
@@ -5,13 +5,28 @@ __date__ = "2023-03-22"
 __license__ = "GPLv3"
 __version__ = "1.0.0"
 
+import math
 from typing import Tuple
 from types import ModuleType
 import numpy as np
-from .. import const
+from .. import const, generator_from_global_state, HAS_NUMBA, njit, prange
 from ._kinematics import Kinematics
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _rotate_velocities(du, dv, r, phi_rad, vel_grad, v_lsr):
+    """ adds the rotation velocity and rotates 1D arrays of du, dv into the Sun's frame """
+    u = np.empty(r.size)
+    v = np.empty(r.size)
+    for i in prange(r.size):
+        v1 = min(vel_grad * r[i], v_lsr) + dv[i]
+        cos_phi = math.cos(phi_rad[i])
+        sin_phi = math.sin(phi_rad[i])
+        u[i] = du[i] * cos_phi + v1 * sin_phi
+        v[i] = -du[i] * sin_phi + v1 * cos_phi
+    return u, v
+
+
 class VelocityGradient(Kinematics):
     """
     The Kinematics base class for a Population class. The appropriate subclass is
@@ -56,6 +71,7 @@ class VelocityGradient(Kinematics):
         self.sigma_v = sigma_v
         self.sigma_w = sigma_w
         self.vel_grad = vel_grad
+        self._rng = generator_from_global_state()
 
     def draw_random_velocity(
             self, x: np.ndarray or float, y: np.ndarray or float,
@@ -79,8 +95,16 @@ class VelocityGradient(Kinematics):
         r, phi_rad, z = self.coord_trans.xyz_to_rphiz(x, y, z)
 
         # Draw random deviations from circular velocity
-        du, dv, dw = np.random.normal(0, [self.sigma_u, self.sigma_v, self.sigma_w],
-                                      (*r.shape, 3)).T
+        du = self._rng.standard_normal(r.shape) * self.sigma_u
+        dv = self._rng.standard_normal(r.shape) * self.sigma_v
+        dw = self._rng.standard_normal(r.shape) * self.sigma_w
+
+        if HAS_NUMBA:
+            u, v = _rotate_velocities(
+                du.ravel(), dv.ravel(), np.ravel(r), np.ravel(phi_rad),
+                self.vel_grad, self.sun.v_lsr)
+            # [()] converts 0-d arrays back to scalars
+            return u.reshape(r.shape)[()], v.reshape(r.shape)[()], dw
 
         # Calculate rotation velocity based on inner solid body rotation and outer velocity gradient
         # Account for asymmetric drift if indicated
@@ -91,8 +115,10 @@ class VelocityGradient(Kinematics):
         v1 = rotation_velocity + dv
 
         # Rotate into Sun's frame
-        u = u1 * np.cos(phi_rad) + v1 * np.sin(phi_rad)
-        v = -u1 * np.sin(phi_rad) + v1 * np.cos(phi_rad)
+        cos_phi = np.cos(phi_rad)
+        sin_phi = np.sin(phi_rad)
+        u = u1 * cos_phi + v1 * sin_phi
+        v = -u1 * sin_phi + v1 * cos_phi
         w = dw
 
         return u, v, w
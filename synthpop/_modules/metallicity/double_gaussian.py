@@ -111,9 +111,9 @@ class DoubleGaussian(Metallicity):
             val = self._gen_met(N)
             while True:
                 outside = (self.lower > val) | (val > self.upper)
-                if not any(outside):
+                if not outside.any():
                     return val
-                val[outside] = self._gen_met(sum(outside))
+                val[outside] = self._gen_met(np.count_nonzero(outside))
 
     def average_metallicity(self) -> float:
         """Determine the average metallicity of the population"""
@@ -89,9 +89,9 @@ class Gaussian(Metallicity):
             val = np.random.normal(mean, self.std, N)
             while True:
                 outside = (self.lower > val) | (val > self.upper)
-                if not any(outside):
+                if not outside.any():
                     return val
-                val[outside] = np.random.normal(self.mean, self.std, sum(outside))
+                val[outside] = np.random.normal(self.mean, self.std, np.count_nonzero(outside))
 
     def average_metallicity(self) -> float:
         """Determine the average metallicity of the population"""
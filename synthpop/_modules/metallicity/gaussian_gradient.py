@@ -79,9 +79,9 @@ class GaussianGradient(Metallicity):
             val = np.random.normal(self.mean, self.std, N)
             while True:
                 outside = (self.lower > val) | (val > self.upper)
-                if not any(outside):
+                if not outside.any():
                     break
-                val[outside] = np.random.normal(self.mean, self.std, sum(outside))
+                val[outside] = np.random.normal(self.mean, self.std, np.count_nonzero(outside))
 
         # add radial_gradient
         radius = np.sqrt(x**2 + y**2)
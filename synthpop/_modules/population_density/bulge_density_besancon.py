@@ -8,11 +8,27 @@ __date__ = "2022-07-12"
 __license__ = "GPLv3"
 __version__ = "1.0.0"
 
+import math
 import numpy as np
-from .. import const
+from .. import const, HAS_NUMBA, njit, prange
 from ._population_density import PopulationDensity
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _besancon_density(r, phi_rad, z, x0, y0, z0, Rc, n0, bar_ang):
+    """ evaluates the bulge density for 1D arrays of r, phi_rad and z """
+    rho = np.empty(r.size)
+    for i in prange(r.size):
+        delta_phi = phi_rad[i] - bar_ang
+        xb = -r[i] * math.cos(delta_phi) / x0
+        yb = r[i] * math.sin(delta_phi) / y0
+        zb = z[i] / z0
+        rs_squared = math.sqrt((xb * xb + yb * yb) ** 2 + zb ** 4)
+        edge = max(r[i] - Rc, 0.)
+        rho[i] = n0 * math.exp(-0.5 * rs_squared - 2 * edge * edge)
+    return rho
+
+
 class BulgeDensityBesancon(PopulationDensity):
     def __init__(self, x0=1.59, y0=0.424, z0=0.424, Rc=2.54, n0=1.37e10, bar_angle=11.1, **kwargs):
 
@@ -61,18 +77,39 @@ class BulgeDensityBesancon(PopulationDensity):
             mass density or initial mass density should be specified in density_unit.
 
         """
+        if HAS_NUMBA:
+            r, phi_rad, z = np.broadcast_arrays(
+                np.asarray(r, dtype=float), np.asarray(phi_rad, dtype=float),
+                np.asarray(z, dtype=float))
+            rho = _besancon_density(
+                r.ravel(), phi_rad.ravel(), z.ravel(),
+                self.x0, self.y0, self.z0, self.Rc, self.n0, self.bar_ang)
+            # [()] converts 0-d arrays back to scalars
+            return rho.reshape(r.shape)[()]
+
         # align coordinates with the bar,
         # x is pointing away from us.
-        xb = -r * np.cos(phi_rad - self.bar_ang)
-        yb = r * np.sin(phi_rad - self.bar_ang)
+        delta_phi = phi_rad - self.bar_ang
+        xb = -r * np.cos(delta_phi)
+        yb = r * np.sin(delta_phi)
         zb = z
 
-        # calculations
-        rs_squared = np.sqrt(((xb / self.x0) ** 2 + (yb / self.y0) ** 2) ** 2 + (zb / self.z0) ** 4)
+        # calculations, accumulated in place to avoid large temporary arrays
+        # rs^2 = sqrt(((xb/x0)^2 + (yb/y0)^2)^2 + (zb/z0)^4) (Robin et al. 2003)
+        rs_squared = (xb / self.x0) ** 2
+        rs_squared += (yb / self.y0) ** 2
+        rs_squared *= rs_squared
+        rs_squared += (zb / self.z0) ** 4
+        rs_squared **= 0.5
 
-        rho = self.n0 * np.exp(-0.5 * rs_squared)
+        # 0 if sqrt(xb**2+yb**2) < Rc,
+        # (xb, yb) is a rotation of the cylindrical coordinates, i.e. sqrt(xb**2+yb**2) = r
+        edge = np.maximum(r - self.Rc, 0)
+        edge *= edge
 
-        # 1 if sqrt(xb**2+yb**2) < Rc
-        rho *= np.exp(-2 * np.maximum(np.sqrt(xb ** 2 + yb ** 2) - self.Rc, 0) ** 2)
+        # combine both exponential terms into a single exp
+        exponent = -0.5 * rs_squared
+        exponent -= 2 * edge
+        rho = self.n0 * np.exp(exponent)
 
         return rho
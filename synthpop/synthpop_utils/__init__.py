@@ -4,3 +4,4 @@ from .json_loader import json_loader
 from .synthpop_logging import log_basic_statistics
 from .synthpop_control import parser, Parameters, PopParams, ModuleKwargs
 from .sun_info import SunInfo, default_sun
+from .numba_utils import HAS_NUMBA, njit, prange
@@ -0,0 +1,19 @@
+""" Optional numba support, kernels fall back to numpy if numba is not installed """
+__all__ = ["HAS_NUMBA", "njit", "prange"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+
+try:
+    # numba can be installed, but fail to import, e.g. for an unsupported numpy version
+    from numba import njit, prange
+    HAS_NUMBA = True
+
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """ replacement for numba.njit, returns the function unchanged """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
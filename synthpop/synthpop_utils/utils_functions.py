@@ -1,5 +1,6 @@
 """ This file contains several utils function """
-__all__ = ['solidangle_to_half_cone_angle', 'half_cone_angle_to_solidangle', "rotation_matrix"]
+__all__ = ['solidangle_to_half_cone_angle', 'half_cone_angle_to_solidangle', "rotation_matrix",
+           "generator_from_global_state"]
 __credits__ = ["J. Klüter", "S. Johnson", "M.J. Huston", "A. Aronica", "M. Penny"]
 __license__ = "GPLv3"
 __version__ = "1.0.0"
@@ -16,6 +17,19 @@ def half_cone_angle_to_solidangle(cone_angle):
     return (2. * np.pi) * (1 - np.cos(cone_angle))
 
 
+def generator_from_global_state() -> np.random.Generator:
+    """
+    creates a numpy Generator seeded from the global numpy random state.
+    The global state is seeded with the random_seed of the configuration,
+    so results stay reproducible when using the Generator.
+
+    Returns
+    -------
+    rng : np.random.Generator
+    """
+    return np.random.default_rng(np.random.randint(2 ** 31 - 1))
+
+
 def rotation_matrix(
         theta_rad: float or np.ndarray or None = None,
         st: float or np.ndarray or None = None, ct: float or np.ndarray or None = None,